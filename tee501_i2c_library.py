@@ -1,227 +1,370 @@
-# -*- coding: utf-8 -*-
-"""
-Read functions for measurement values of the TEE501 Sensor via I2c interface.
-
-Copyright 2023 E+E Elektronik Ges.m.b.H.
-
-Disclaimer:
-This application example is non-binding and does not claim to be complete with
-regard to configuration and equipment as well as all eventualities. The
-application example is intended to provide assistance with the TEE501 sensor
-module design-in and is provided "as is".You yourself are responsible for the
-proper operation of the products described. This application example does not
-release you from the obligation to handle the product safely during
-application, installation, operation and maintenance. By using this application
-example, you acknowledge that we cannot be held liable for any damage beyond
-the liability regulations described.
-
-We reserve the right to make changes to this application example at any time
-without notice. In case of discrepancies between the suggestions in this
-application example and other E+E publications, such as catalogues, the content
-of the other documentation takes precedence. We assume no liability for
-the information contained in this document.
-"""
-
-
-# pylint: disable=E0401
-from smbus2 import SMBus, i2c_msg
-# pylint: enable=E0401
-CRC8_ONEWIRE_POLY = 0x31
-CRC8_ONEWIRE_START = 0xFF
-TEE501_COMMAND_READ_SINGLE_SHOT = 0x2C1B
-TEE501_COMMAND_READ_PERIODIC_MEASUREMENT = 0xE000
-TEE501_COMMAND_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING = 0xE016
-TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS = 0x72A7
-TEE501_COMMAND_CLEAR_REGISTER_1 = 0x3041
-TEE501_COMMAND_READ_REGISTER_1 = 0xF32D
-TEE501_COMMAND_READ_REGISTER_2 = 0xF352
-TEE501_COMMAND_START_PERIODIC_MEASUREMENT = 0x201E
-TEE501_COMMAND_END_PERIODIC_MEASUREMENT = 0x3093
-TEE501_COMMAND_SOFT_RESET = 0x30A2
-TEE501_COMMAND_READ_IDENTIFICATION = 0x7029
-TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME = 0x10
-TEE501_REGISTER_MEASUREMENT_RESOLUTION = 0x0F
-
-
-def get_status_string(status_code):
-    """Return string from status_code."""
-    status_string = {
-        0: "Success",
-        1: "Not acknowledge error",
-        2: "Checksum error",
-        3: "Measurement error",
-        4: "error wrong input for change_periodic_measurement_time",
-        5: "error wrong input for change_measurement_resolution",
-    }
-
-    if status_code < len(status_string):
-        return status_string[status_code]
-    return "Unknown error"
-
-
-def calc_crc8(buf, start, end):
-    ''' calculate crc8 checksum  '''
-    crc_val = CRC8_ONEWIRE_START
-    for j in range(start, end):
-        cur_val = buf[j]
-        for _ in range(8):
-            if ((crc_val ^ cur_val) & 0x80) != 0:
-                crc_val = (crc_val << 1) ^ CRC8_ONEWIRE_POLY
-            else:
-                crc_val = crc_val << 1
-            cur_val = cur_val << 1
-    crc_val &= 0xFF
-    return crc_val
-
-
-class TEE501():
-    """Implements communication with TEE501 over i2c with a specific address."""
-
-    def __init__(self, i2c_address):
-        self.i2c_address = i2c_address
-
-    def get_single_shot_temp_clock_stretching_disabled(self):
-        """Let the sensor take a measurement and return the temperature value."""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING >> 8),
-             (TEE501_COMMAND_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING & 0xFF)], 3)
-        if i2c_response[2] == calc_crc8(i2c_response, 0, 2):
-            temperature = ((float)(i2c_response[0]) * 256 + i2c_response[1])
-            if temperature > 55536:
-                temperature = (temperature - 65536) / 100
-            else:
-                temperature = temperature / 100
-            return temperature
-        else:
-            raise Warning(get_status_string(2))
-
-    def get_single_shot_temp(self):
-        """Let the sensor take a measurement and return the temperature value."""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_SINGLE_SHOT >> 8),
-             (TEE501_COMMAND_READ_SINGLE_SHOT & 0xFF)], 3)
-        if i2c_response[2] == calc_crc8(i2c_response, 0, 2):
-            temperature = ((float)(i2c_response[0]) * 256 + i2c_response[1])
-            if temperature > 55536:
-                temperature = (temperature - 65536) / 100
-            else:
-                temperature = temperature / 100
-            return temperature
-        else:
-            raise Warning(get_status_string(2))
-
-    def get_periodic_measurement_temp(self):
-        """Get the last measurement from the periodic measurement for temperature"""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_PERIODIC_MEASUREMENT >> 8),
-             (TEE501_COMMAND_READ_PERIODIC_MEASUREMENT & 0xFF)], 3)
-        if i2c_response[2] == calc_crc8(i2c_response, 0, 2):
-            temperature = ((float)(i2c_response[0]) * 256 + i2c_response[1])
-            if temperature > 55536:
-                temperature = (temperature - 65536) / 100
-            else:
-                temperature = temperature / 100
-            return temperature
-        else:
-            raise Warning(get_status_string(2))
-
-    def change_periodic_measurement_time(self, milli_sec):
-        """chnage the time between measurements in the periodic measurement mode"""
-        if milli_sec < 3276751:
-            value = milli_sec/50
-            send_bytes = [0, 0]
-            send_bytes[1] = int(value / 255)
-            send_bytes[0] = int(value % 256)
-            self.wire_write(
-                [(TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS >> 8),
-                 (TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS & 0xFF),
-                 TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME,
-                 send_bytes[0], send_bytes[1],
-                 calc_crc8([0x10, send_bytes[0], send_bytes[1]], 0, 3)])
-        else:
-            raise Warning(get_status_string(4))
-
-    def read_periodic_measurement_time(self):
-        """reads the time between measurements in the periodic measurement mode"""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS >> 8),
-             (TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS & 0xFF),
-             TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME], 2)
-        value = i2c_response[1] * 256 + i2c_response[0]
-        return value * 0.05
-
-    def change_measurement_resolution(self, meas_res_temp): 		#8 - 14 Bit
-        """change the resolution of the measurements"""
-        if (7 < meas_res_temp < 15):
-            send_byte = (meas_res_temp - 8)
-            self.wire_write(
-                [(TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS >> 8),
-                 (TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS & 0xFF),
-                 TEE501_REGISTER_MEASUREMENT_RESOLUTION,
-                 send_byte, calc_crc8([0x0F, send_byte], 0, 2)])
-        else:
-            raise Warning(get_status_string(5))
-
-    def read_measurement_resolution(self):
-        """reads the resolution of the measurements"""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS >> 8),
-             (TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS & 0xFF),
-             TEE501_REGISTER_MEASUREMENT_RESOLUTION], 1)
-        i2c_response[0] = (i2c_response[0] << 5) & 255
-        i2c_response[0] = i2c_response[0] >> 5
-        return i2c_response[0] + 8
-
-    def start_periodic_measurement(self):
-        """starts the periodic measurement"""
-        self.wire_write([(TEE501_COMMAND_START_PERIODIC_MEASUREMENT >> 8),
-                        (TEE501_COMMAND_START_PERIODIC_MEASUREMENT & 0xFF)])
-
-    def end_periodic_measurement(self):
-        """ends the periodic measurement"""
-        self.wire_write([(TEE501_COMMAND_END_PERIODIC_MEASUREMENT >> 8),
-                         (TEE501_COMMAND_END_PERIODIC_MEASUREMENT & 0xFF)])
-
-    def read_identification(self):
-        """reads the identification number"""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_IDENTIFICATION >> 8),
-             (TEE501_COMMAND_READ_IDENTIFICATION & 0xFF)], 9)
-        if i2c_response[8] == calc_crc8(i2c_response, 0, 8):
-            return i2c_response
-        else:
-            raise Warning(get_status_string(2))
-
-    def reset(self):
-        """resets the sensor"""
-        self.wire_write([(TEE501_COMMAND_SOFT_RESET >> 8),
-                         (TEE501_COMMAND_SOFT_RESET & 0xFF)])
-
-    def new_measurement_ready(self):
-        """get information if a new measurement is ready"""
-        i2c_response = self.wire_write_read(
-            [(TEE501_COMMAND_READ_REGISTER_2 >> 8),
-             (TEE501_COMMAND_READ_REGISTER_2 & 0xFF)], 3)
-        if i2c_response[2] == calc_crc8(i2c_response, 0, 2):
-            return i2c_response[0] >> 7
-        else:
-            raise Warning(get_status_string(2))
-
-    def clear_statusregister_1(self):
-        """clear the status register 1"""
-        self.wire_write([(TEE501_COMMAND_SOFT_RESET >> 8),
-                         (TEE501_COMMAND_SOFT_RESET & 0xFF)])
-
-    def wire_write_read(self,  buf, receiving_bytes):
-        """write a command to the sensor to get different answers like temperature values,..."""
-        write_command = i2c_msg.write(self.i2c_address, buf)
-        read_command = i2c_msg.read(self.i2c_address, receiving_bytes)
-        with SMBus(1) as tee501_communication:
-            tee501_communication.i2c_rdwr(write_command, read_command)
-        return list(read_command)
-
-    def wire_write(self, buf):
-        """write to the sensor"""
-        write_command = i2c_msg.write(self.i2c_address, buf)
-        with SMBus(1) as tee501_communication:
-            tee501_communication.i2c_rdwr(write_command)
+# -*- coding: utf-8 -*-
+"""
+Read functions for measurement values of the TEE501 Sensor via I2c interface.
+
+Failed transactions raise TEE501Error, which carries the numeric status
+code as its `code` attribute (see get_status_string for the meanings).
+
+Copyright 2023 E+E Elektronik Ges.m.b.H.
+
+Disclaimer:
+This application example is non-binding and does not claim to be complete with
+regard to configuration and equipment as well as all eventualities. The
+application example is intended to provide assistance with the TEE501 sensor
+module design-in and is provided "as is".You yourself are responsible for the
+proper operation of the products described. This application example does not
+release you from the obligation to handle the product safely during
+application, installation, operation and maintenance. By using this application
+example, you acknowledge that we cannot be held liable for any damage beyond
+the liability regulations described.
+
+We reserve the right to make changes to this application example at any time
+without notice. In case of discrepancies between the suggestions in this
+application example and other E+E publications, such as catalogues, the content
+of the other documentation takes precedence. We assume no liability for
+the information contained in this document.
+"""
+
+
+# pylint: disable=E0401
+from smbus2 import SMBus, i2c_msg
+# pylint: enable=E0401
+CRC8_ONEWIRE_POLY = 0x31
+CRC8_ONEWIRE_START = 0xFF
+TEE501_COMMAND_READ_SINGLE_SHOT = 0x2C1B
+TEE501_COMMAND_READ_PERIODIC_MEASUREMENT = 0xE000
+TEE501_COMMAND_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING = 0xE016
+TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS = 0x72A7
+TEE501_COMMAND_CLEAR_REGISTER_1 = 0x3041
+TEE501_COMMAND_READ_REGISTER_1 = 0xF32D
+TEE501_COMMAND_READ_REGISTER_2 = 0xF352
+TEE501_COMMAND_START_PERIODIC_MEASUREMENT = 0x201E
+TEE501_COMMAND_END_PERIODIC_MEASUREMENT = 0x3093
+TEE501_COMMAND_SOFT_RESET = 0x30A2
+TEE501_COMMAND_READ_IDENTIFICATION = 0x7029
+TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME = 0x10
+TEE501_REGISTER_MEASUREMENT_RESOLUTION = 0x0F
+
+
+def _command_bytes(command):
+    ''' split a 16-bit command word into its big-endian byte pair '''
+    return bytes([(command >> 8) & 0xFF, command & 0xFF])
+
+
+_CMD_READ_SINGLE_SHOT = _command_bytes(TEE501_COMMAND_READ_SINGLE_SHOT)
+_CMD_READ_PERIODIC_MEASUREMENT = _command_bytes(
+    TEE501_COMMAND_READ_PERIODIC_MEASUREMENT)
+_CMD_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING = _command_bytes(
+    TEE501_COMMAND_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING)
+_CMD_READ_WRITE_SENSOR_SETTINGS = _command_bytes(
+    TEE501_COMMAND_READ_WRITE_SENSOR_SETTINGS)
+_CMD_CLEAR_REGISTER_1 = _command_bytes(TEE501_COMMAND_CLEAR_REGISTER_1)
+_CMD_READ_REGISTER_1 = _command_bytes(TEE501_COMMAND_READ_REGISTER_1)
+_CMD_READ_REGISTER_2 = _command_bytes(TEE501_COMMAND_READ_REGISTER_2)
+_CMD_START_PERIODIC_MEASUREMENT = _command_bytes(
+    TEE501_COMMAND_START_PERIODIC_MEASUREMENT)
+_CMD_END_PERIODIC_MEASUREMENT = _command_bytes(
+    TEE501_COMMAND_END_PERIODIC_MEASUREMENT)
+_CMD_SOFT_RESET = _command_bytes(TEE501_COMMAND_SOFT_RESET)
+_CMD_READ_IDENTIFICATION = _command_bytes(TEE501_COMMAND_READ_IDENTIFICATION)
+
+# the i2c-dev driver caps one I2C_RDWR ioctl at 42 messages
+# (I2C_RDWR_IOCTL_MAX_MSGS), which is 21 write/read pairs
+_RDWR_MAX_PAIRS = 21
+
+
+_STATUS_STRINGS = (
+    "Success",
+    "Not acknowledge error",
+    "Checksum error",
+    "Measurement error",
+    "error wrong input for change_periodic_measurement_time",
+    "error wrong input for change_measurement_resolution",
+    "settings readback verification failed",
+)
+
+
+def get_status_string(status_code):
+    """Return string from status_code."""
+    if 0 <= status_code < len(_STATUS_STRINGS):
+        return _STATUS_STRINGS[status_code]
+    return "Unknown error"
+
+
+class TEE501Error(Exception):
+    """Raised when a sensor transaction fails or gets invalid input."""
+
+    def __init__(self, code):
+        super().__init__(get_status_string(code))
+        self.code = code
+
+
+def _calc_crc8_table_entry(index):
+    ''' run the crc8 polynomial loop once for a single table index '''
+    crc_val = index
+    for _ in range(8):
+        if (crc_val & 0x80) != 0:
+            crc_val = ((crc_val << 1) ^ CRC8_ONEWIRE_POLY) & 0xFF
+        else:
+            crc_val = (crc_val << 1) & 0xFF
+    return crc_val
+
+
+_CRC8_TABLE = bytes(_calc_crc8_table_entry(index) for index in range(256))
+
+
+def _calc_crc8_lut(buf, start, end):
+    ''' calculate crc8 checksum with the lookup table '''
+    crc_val = CRC8_ONEWIRE_START
+    table = _CRC8_TABLE
+    for j in range(start, end):
+        crc_val = table[crc_val ^ buf[j]]
+    return crc_val
+
+
+def _crc8_2(byte_0, byte_1):
+    ''' crc8 fast path for the common 2-byte responses, no loop overhead '''
+    table = _CRC8_TABLE
+    return table[table[CRC8_ONEWIRE_START ^ byte_0] ^ byte_1]
+
+
+try:
+    # pylint: disable=E0401
+    from fastcrc import crc8 as _fastcrc_crc8
+    # pylint: enable=E0401
+
+    def calc_crc8(buf, start, end):
+        ''' calculate crc8 checksum  '''
+        # the nrsc-5 variant matches the sensor crc exactly:
+        # poly 0x31, init 0xFF, no reflection, no final xor
+        return _fastcrc_crc8.nrsc_5(bytes(buf[start:end]))
+except ImportError:
+    calc_crc8 = _calc_crc8_lut
+
+
+try:
+    # pylint: disable=E0401
+    import numpy
+    from numba import njit
+    # pylint: enable=E0401
+
+    @njit(cache=True, boundscheck=False)
+    def _calc_crc8_numba(buf, start, end):
+        crc_val = 0xFF
+        for j in range(start, end):
+            crc_val ^= buf[j]
+            for _ in range(8):
+                if crc_val & 0x80:
+                    crc_val = ((crc_val << 1) ^ 0x31) & 0xFF
+                else:
+                    crc_val = (crc_val << 1) & 0xFF
+        return crc_val
+
+    def calc_crc8_bulk(buf):
+        ''' calculate crc8 checksum over a whole buffer of readings '''
+        data = numpy.ascontiguousarray(buf, dtype=numpy.uint8)
+        return _calc_crc8_numba(data, 0, data.shape[0])
+except ImportError:
+    def calc_crc8_bulk(buf):
+        ''' calculate crc8 checksum over a whole buffer of readings '''
+        return calc_crc8(buf, 0, len(buf))
+
+
+class TEE501():
+    """Implements communication with TEE501 over i2c with a specific address."""
+
+    def __init__(self, i2c_address, bus=1):
+        self.i2c_address = i2c_address
+        self.i2c_bus = bus
+        self._bus = None
+        self._msg_read_periodic = i2c_msg.write(
+            i2c_address, _CMD_READ_PERIODIC_MEASUREMENT)
+        self._msg_start_periodic = i2c_msg.write(
+            i2c_address, _CMD_START_PERIODIC_MEASUREMENT)
+        self._msg_end_periodic = i2c_msg.write(
+            i2c_address, _CMD_END_PERIODIC_MEASUREMENT)
+        self._msg_soft_reset = i2c_msg.write(i2c_address, _CMD_SOFT_RESET)
+        self._msg_clear_register_1 = i2c_msg.write(
+            i2c_address, _CMD_CLEAR_REGISTER_1)
+        # reusable crc input buffers for the settings writes, first byte is
+        # the register address and never changes
+        self._crc_buf_time = bytearray(
+            [TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME, 0, 0])
+        self._crc_buf_resolution = bytearray(
+            [TEE501_REGISTER_MEASUREMENT_RESOLUTION, 0])
+
+    def _get_bus(self):
+        """return the open SMBus handle, opening it on first use"""
+        if self._bus is None:
+            self._bus = SMBus(self.i2c_bus)
+        return self._bus
+
+    def close(self):
+        """close the SMBus handle if it is open"""
+        if self._bus is not None:
+            self._bus.close()
+            self._bus = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _decode_temperature(self, i2c_response):
+        """check the crc and convert a 3 byte response to a temperature value"""
+        if i2c_response[2] != _crc8_2(i2c_response[0], i2c_response[1]):
+            raise TEE501Error(2)
+        # the temperature word is a signed 16-bit big-endian value scaled by
+        # 100, so signed=True already covers the negative range and the final
+        # divide is the only floating point operation in the decode
+        return int.from_bytes(bytes(i2c_response[0:2]), 'big', signed=True) / 100.0
+
+    def get_single_shot_temp_clock_stretching_disabled(self):
+        """Let the sensor take a measurement and return the temperature value."""
+        return self._decode_temperature(self.wire_write_read(
+            _CMD_READ_SINGLE_SHOT_WITHOUT_CLOCK_STRETCHING, 3))
+
+    def get_single_shot_temp(self):
+        """Let the sensor take a measurement and return the temperature value."""
+        return self._decode_temperature(self.wire_write_read(
+            _CMD_READ_SINGLE_SHOT, 3))
+
+    def get_periodic_measurement_temp(self):
+        """Get the last measurement from the periodic measurement for temperature"""
+        return self._decode_temperature(self.wire_write_read(
+            _CMD_READ_PERIODIC_MEASUREMENT, 3))
+
+    def stream_temps(self, count):
+        """Get count measurements from the periodic measurement in batched bus transactions."""
+        if count <= 0:
+            return []
+        address = self.i2c_address
+        bus = self._get_bus()
+        read_commands = [i2c_msg.read(address, 3) for _ in range(count)]
+        # the i2c-dev driver rejects an I2C_RDWR ioctl with more than 42
+        # messages (I2C_RDWR_IOCTL_MAX_MSGS), so submit at most 21
+        # write/read pairs per call
+        for chunk_start in range(0, count, _RDWR_MAX_PAIRS):
+            messages = []
+            for read_command in read_commands[chunk_start:
+                                              chunk_start + _RDWR_MAX_PAIRS]:
+                messages.append(self._msg_read_periodic)
+                messages.append(read_command)
+            bus.i2c_rdwr(*messages)
+        return [self._decode_temperature(bytes(read_command))
+                for read_command in read_commands]
+
+    def _write_and_verify(self, payload, register, receiving_bytes):
+        """write a settings payload and read the register back in one bus transaction"""
+        address = self.i2c_address
+        write_command = i2c_msg.write(address, payload)
+        readback_command = i2c_msg.write(
+            address, _CMD_READ_WRITE_SENSOR_SETTINGS + bytes([register]))
+        read_command = i2c_msg.read(address, receiving_bytes)
+        self._get_bus().i2c_rdwr(write_command, readback_command, read_command)
+        return bytes(read_command)
+
+    def change_periodic_measurement_time(self, milli_sec, verify=False):
+        """chnage the time between measurements in the periodic measurement mode"""
+        if milli_sec < 3276751:
+            value = int(milli_sec // 50)
+            low_byte = value & 0xFF
+            high_byte = (value >> 8) & 0xFF
+            crc_buf = self._crc_buf_time
+            crc_buf[1] = low_byte
+            crc_buf[2] = high_byte
+            payload = (_CMD_READ_WRITE_SENSOR_SETTINGS +
+                       bytes([TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME,
+                              low_byte, high_byte, calc_crc8(crc_buf, 0, 3)]))
+            if verify:
+                readback = self._write_and_verify(
+                    payload, TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME, 2)
+                if readback != bytes([low_byte, high_byte]):
+                    raise TEE501Error(6)
+            else:
+                self.wire_write(payload)
+        else:
+            raise TEE501Error(4)
+
+    def read_periodic_measurement_time(self):
+        """reads the time between measurements in the periodic measurement mode"""
+        i2c_response = self.wire_write_read(
+            _CMD_READ_WRITE_SENSOR_SETTINGS +
+            bytes([TEE501_REGISTER_PERIODIC_MEASUREMENT_TIME]), 2)
+        return int.from_bytes(bytes(i2c_response[0:2]), 'little') * 0.05
+
+    def change_measurement_resolution(self, meas_res_temp, verify=False): 	#8 - 14 Bit
+        """change the resolution of the measurements"""
+        if (7 < meas_res_temp < 15):
+            send_byte = (meas_res_temp - 8)
+            crc_buf = self._crc_buf_resolution
+            crc_buf[1] = send_byte
+            payload = (_CMD_READ_WRITE_SENSOR_SETTINGS +
+                       bytes([TEE501_REGISTER_MEASUREMENT_RESOLUTION,
+                              send_byte, calc_crc8(crc_buf, 0, 2)]))
+            if verify:
+                readback = self._write_and_verify(
+                    payload, TEE501_REGISTER_MEASUREMENT_RESOLUTION, 1)
+                if (readback[0] & 0x07) != send_byte:
+                    raise TEE501Error(6)
+            else:
+                self.wire_write(payload)
+        else:
+            raise TEE501Error(5)
+
+    def read_measurement_resolution(self):
+        """reads the resolution of the measurements"""
+        i2c_response = self.wire_write_read(
+            _CMD_READ_WRITE_SENSOR_SETTINGS +
+            bytes([TEE501_REGISTER_MEASUREMENT_RESOLUTION]), 1)
+        return (i2c_response[0] & 0x07) + 8
+
+    def start_periodic_measurement(self):
+        """starts the periodic measurement"""
+        self._get_bus().i2c_rdwr(self._msg_start_periodic)
+
+    def end_periodic_measurement(self):
+        """ends the periodic measurement"""
+        self._get_bus().i2c_rdwr(self._msg_end_periodic)
+
+    def read_identification(self):
+        """reads the identification number"""
+        i2c_response = self.wire_write_read(_CMD_READ_IDENTIFICATION, 9)
+        if i2c_response[8] == calc_crc8(i2c_response, 0, 8):
+            return i2c_response
+        else:
+            raise TEE501Error(2)
+
+    def reset(self):
+        """resets the sensor"""
+        self._get_bus().i2c_rdwr(self._msg_soft_reset)
+
+    def new_measurement_ready(self):
+        """get information if a new measurement is ready"""
+        i2c_response = self.wire_write_read(_CMD_READ_REGISTER_2, 3)
+        if i2c_response[2] == _crc8_2(i2c_response[0], i2c_response[1]):
+            return i2c_response[0] >> 7
+        else:
+            raise TEE501Error(2)
+
+    def clear_statusregister_1(self):
+        """clear the status register 1"""
+        self._get_bus().i2c_rdwr(self._msg_clear_register_1)
+
+    def wire_write_read(self,  buf, receiving_bytes):
+        """write a command to the sensor to get different answers like temperature values,...
+
+        buf should be a bytes object; smbus2 then fills the message
+        buffer with one memmove instead of storing element by element.
+        """
+        address = self.i2c_address
+        write_command = i2c_msg.write(address, buf)
+        read_command = i2c_msg.read(address, receiving_bytes)
+        self._get_bus().i2c_rdwr(write_command, read_command)
+        return bytes(read_command)
+
+    def wire_write(self, buf):
+        """write to the sensor, buf should be a bytes object"""
+        write_command = i2c_msg.write(self.i2c_address, buf)
+        self._get_bus().i2c_rdwr(write_command)
@@ -23,7 +23,7 @@ We assume no liability for the information contained in this document.
 
 
 import time
-from tee501_i2c_library import TEE501
+from tee501_i2c_library import TEE501, TEE501Error
 
 
 # Definition
@@ -38,7 +38,7 @@ try:
     TEE_501.change_periodic_measurement_time(5000)
     print("periodic measurement time interval is: "+str(TEE_501.read_periodic_measurement_time()) +
           " s")
-except Warning as exception:
+except TEE501Error as exception:
     print("Exception: " + str(exception))
 
 TEE_501.start_periodic_measurement()
@@ -53,7 +53,7 @@ for i in range(300):
 
             print('%0.2f °C' % temperature)
 
-    except Warning as exception:
+    except TEE501Error as exception:
         print("Exception: " + str(exception))
 
     finally:
@@ -22,7 +22,7 @@ We assume no liability for the information contained in this document.
 
 
 import time
-from tee501_i2c_library import TEE501
+from tee501_i2c_library import TEE501, TEE501Error
 
 
 # Definition
@@ -35,7 +35,7 @@ TEE_501 = TEE501(0x48)
 try:
     print("identification: " + ''.join('{:02x}'.format(x) for x in TEE_501.read_identification()))
 
-except Warning as exception:
+except TEE501Error as exception:
     print("Exception: " + str(exception))
 
 # print csv header
@@ -48,7 +48,7 @@ for i in range(30):
 
         print('%0.2f °C' % temperature)
 
-    except Warning as exception:
+    except TEE501Error as exception:
         print("Exception: " + str(exception))
 
     finally: